@@ -29,6 +29,7 @@ data_params_valid_individual = [
     (['-t1', str(0.5), '-t2', str(1.0)]),
     (['-uh', str(15)]),
     (['--snr-min', str(10), '--snr-max', str(50)]),
+    (['-s', str(2500), '-w', str(2)]),
     # ([]), ([]),
     # etc...
 ]
@@ -53,6 +54,7 @@ data_params_invalid_individual = [
     (['--snr-max', str(10)]),
     (['--number-uav', str(2)]),
     (['--number-user', str(4)]),
+    (['--workers', str(0)]),
 ]
 
 # How many values of each parameter to test in combination
@@ -94,6 +94,16 @@ def test_position_uav_invalid(number_uav, radius_uav, height_uav):
     # function will work its math without throwing exceptions
     random_position_uav(number_uav, radius_uav, height_uav)
 
+# Test that positions are reproducible when using generators with the same seed
+@pytest.mark.parametrize("number_uav, radius_uav, height_uav", data_parameter_position_uav_valid)
+def test_position_seed(number_uav, radius_uav, height_uav):
+    uav_a = random_position_uav(number_uav, radius_uav, height_uav, 10, np.random.default_rng(123))
+    uav_b = random_position_uav(number_uav, radius_uav, height_uav, 10, np.random.default_rng(123))
+    users_a = random_position_users(2, radius_uav, 10, np.random.default_rng(123))
+    users_b = random_position_users(2, radius_uav, 10, np.random.default_rng(123))
+    np.testing.assert_array_equal(uav_a, uav_b)
+    np.testing.assert_array_equal(users_a, users_b)
+
 # Test rician fading (valid parameters)
 @pytest.mark.parametrize("rician_factor, power_los", data_parameter_rician_fading_valid)
 def test_rician_parameters_valid(rician_factor, power_los):
@@ -126,3 +136,41 @@ def test_channel_gain_valid(number_user, x_u, y_u, x_r, y_r, uav_height_mean, pa
 def test_channel_gain_invalid(exception, number_user, x_u, y_u, x_r, y_r, uav_height_mean, path_loss, s, sigma):
     with pytest.raises(exception):
         generate_channel(s, sigma, number_user, x_u, y_u, x_r, y_r, uav_height_mean, path_loss)
+
+# Test generate channel for several Monte Carlo samples at once
+@pytest.mark.parametrize("number_user, x_u, y_u, x_r, y_r, uav_height_mean, path_loss, s, sigma", data_parameter_generate_channel_valid)
+def test_channel_gain_samples(number_user, x_u, y_u, x_r, y_r, uav_height_mean, path_loss, s, sigma):
+    samples = 50
+    x_u = np.tile(x_u, (samples, 1))
+    y_u = np.tile(y_u, (samples, 1))
+    channel_gain_primary, channel_gain_secondary = generate_channel(
+        s, sigma, number_user, x_u, y_u, x_r, y_r, uav_height_mean, path_loss
+    )
+    assert channel_gain_primary.shape == (samples,)
+    assert channel_gain_secondary.shape == (samples,)
+    assert np.all(channel_gain_primary >= 0)  # Non-negative
+    assert np.all(channel_gain_primary <= channel_gain_secondary)
+
+# Test generate channel with more than two users, sorting the channel gains
+def test_channel_gain_many_users():
+    number_user = 4
+    x_u = np.array([[1.0, 5.0, 10.0, 15.0]] * 20)
+    y_u = np.zeros((20, number_user))
+    channel_gain_primary, channel_gain_secondary = generate_channel(
+        1.0, 0.1, number_user, x_u, y_u, 0.0, 0.0, 20.0, 2.0, np.random.default_rng(123)
+    )
+    assert channel_gain_primary.shape == (20,)
+    assert np.all(channel_gain_primary <= channel_gain_secondary)
+
+# Test that positions and channel gains can be generated in single precision
+def test_single_precision():
+    rng = np.random.default_rng(123)
+    x_r, y_r, z_r = random_position_uav(1, 2.0, 20.0, 10, rng, np.float32)
+    x_u, y_u = random_position_users(2, 15.0, 10, rng, np.float32)
+    for position in (x_r, y_r, z_r, x_u, y_u):
+        assert position.dtype == np.float32
+    channel_gain_primary, channel_gain_secondary = generate_channel(
+        0.5, 1.3, 2, x_u, y_u, x_r, y_r, z_r, 2.0, rng
+    )
+    assert channel_gain_primary.dtype == np.float32
+    assert channel_gain_secondary.dtype == np.float32
@@ -9,9 +9,9 @@ snr_dB = np.array(range(10, 51, 2))  # SNR in dB
 snr_linear = 10 ** (snr_dB / 10)  # SNR linear
 
 # Initialization of some auxiliary arrays
-out_probability_system = np.zeros((monte_carlo_samples, len(snr_dB)))
-out_probability_secondary_user = np.zeros((monte_carlo_samples, len(snr_dB)))
-out_probability_primary_user = np.zeros((monte_carlo_samples, len(snr_dB)))
+out_probability_system = np.zeros((monte_carlo_samples, len(snr_dB)), dtype=bool)
+out_probability_secondary_user = np.zeros((monte_carlo_samples, len(snr_dB)), dtype=bool)
+out_probability_primary_user = np.zeros((monte_carlo_samples, len(snr_dB)), dtype=bool)
 system_average_rate = np.zeros((monte_carlo_samples, len(snr_dB)))
 rate_secondary_user = np.zeros((monte_carlo_samples, len(snr_dB)))
 rate_primary_user = np.zeros((monte_carlo_samples, len(snr_dB)))
@@ -56,6 +56,12 @@ data_parameter_rate_valid = [
     ) 
 ] """
 
+data_coefficients_valid = [
+    # power_primary, power_secondary, hardware impairments, imperfect SIC coefficient
+    ([0.8, 0.2, 0.05, 0.05]),
+    ([0.6, 0.4, 0.0, 0.1]),
+]
+
 data_target_rate_valid = [
     # Target rate primary user, Target rate secondary user
     ([0.5, 0.5])
@@ -218,3 +224,49 @@ def test_outage_probability(number_user, x_u, y_u, x_r, y_r, uav_height_mean, pa
         or out_probability_secondary_user.all() <= 1
     ), "Invalid, must be non-negative." 
 
+
+# Test that rates broadcast between channel gains and SNR values
+@pytest.mark.parametrize("power_primary, power_secondary, hardw_ip, sic_ip", data_coefficients_valid)
+def test_rate_broadcast(power_primary, power_secondary, hardw_ip, sic_ip):
+    channel_gain = np.array([[1e-4], [1e-3], [1e-2]])
+    rate_primary = calculate_instantaneous_rate_primary(
+        channel_gain, snr_linear, power_primary, power_secondary, hardw_ip
+    )
+    rate_secondary = calculate_instantaneous_rate_secondary(
+        channel_gain, snr_linear, power_secondary, power_primary, hardw_ip, sic_ip
+    )
+    assert rate_primary.shape == (len(channel_gain), len(snr_linear))
+    assert rate_secondary.shape == (len(channel_gain), len(snr_linear))
+    for i in range(len(channel_gain)):
+        for sn in range(len(snr_linear)):
+            assert rate_primary[i, sn] == pytest.approx(calculate_instantaneous_rate_primary(
+                channel_gain[i, 0], snr_linear[sn], power_primary, power_secondary, hardw_ip
+            ))
+            assert rate_secondary[i, sn] == pytest.approx(calculate_instantaneous_rate_secondary(
+                channel_gain[i, 0], snr_linear[sn], power_secondary, power_primary, hardw_ip, sic_ip
+            ))
+
+# Test outage events for known rates
+def test_outage_probability_values():
+    rate_primary = np.array([0.1, 0.6, 0.1, 0.6])
+    rate_secondary = np.array([0.1, 0.1, 0.6, 0.6])
+    out_system, out_primary, out_secondary = outage_probability(
+        rate_primary, rate_secondary, 0.5, 0.5
+    )
+    assert out_system.dtype == bool
+    np.testing.assert_array_equal(out_system, [True, True, True, False])
+    np.testing.assert_array_equal(out_primary, [True, False, True, False])
+    np.testing.assert_array_equal(out_secondary, [True, True, False, False])
+
+# Test rates with integer arguments
+def test_rate_integer_arguments():
+    rate_primary = calculate_instantaneous_rate_primary(1, 10, 1, 0, 0)
+    rate_secondary = calculate_instantaneous_rate_secondary(1, 10, 1, 0, 0, 0)
+    assert rate_primary == pytest.approx(np.log2(11))
+    assert rate_secondary == pytest.approx(np.log2(11))
+
+# Test outage events for scalar rates, which give scalar results
+def test_outage_probability_scalar():
+    out_system, out_primary, out_secondary = outage_probability(0.1, 0.6, 0.5, 0.5)
+    assert np.ndim(out_system) == 0 and not isinstance(out_system, np.ndarray)
+    assert out_system and out_primary and not out_secondary
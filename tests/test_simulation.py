@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+from uavnoma.simulation import simulate
+
+# Variable simulation parameters
+monte_carlo_samples = 500  # Monte Carlo samples
+snr_dB = np.array(range(10, 51, 2))  # SNR in dB
+snr_linear = 10 ** (snr_dB / 10)  # SNR linear
+
+#
+# Valid parameters for testing the simulation module
+#
+
+data_parameter_simulation_valid = [
+    # number_uav, radius_uav, uav_height_mean, number_user, radius_user, rician_factor, power_los, path_loss,
+    # power_primary, power_secondary, hardw_ip, sic_ip, target_rate_primary_user, target_rate_secondary_user
+    ([1, 2.0, 20.0, 2, 15.0, 15.0, 2.0, 2.2, 0.8, 0.2, 0.1, 0.1, 0.5, 0.5]),  # Valid
+    ([1, 4.0, 30.0, 2, 10.0, 10.0, 1.0, 3.0, 0.6, 0.4, 0.0, 0.0, 0.1, 1.0]),  # Valid
+]
+
+# Test simulation results (valid parameters)
+@pytest.mark.parametrize("params", data_parameter_simulation_valid)
+def test_simulate_valid(params):
+    results = simulate(monte_carlo_samples, snr_linear, *params, 123)
+    assert len(results) == 5
+    for result in results:
+        assert result.shape == (len(snr_linear),)
+    out_system, out_primary, out_secondary, rate_primary, rate_secondary = results
+    assert np.all((out_system >= 0) & (out_system <= 1))
+    assert np.all(out_system >= out_primary)  # System outage includes each user's outage
+    assert np.all(out_system >= out_secondary)
+    assert np.all(rate_primary >= 0)  # Non-negative
+    assert np.all(rate_secondary >= 0)  # Non-negative
+    assert np.all(np.diff(rate_primary) >= 0)  # Rates grow with the SNR
+    assert np.all(np.diff(rate_secondary) >= 0)
+
+# Test that the simulation is reproducible with the same seed
+@pytest.mark.parametrize("params", data_parameter_simulation_valid)
+def test_simulate_seed(params):
+    results_a = simulate(monte_carlo_samples, snr_linear, *params, 123)
+    results_b = simulate(monte_carlo_samples, snr_linear, *params, 123)
+    for result_a, result_b in zip(results_a, results_b):
+        np.testing.assert_array_equal(result_a, result_b)
+
+# Test that results do not depend on the number of worker processes
+@pytest.mark.parametrize("params", data_parameter_simulation_valid)
+def test_simulate_workers(params):
+    samples = 2500  # More than one chunk of samples
+    results_serial = simulate(samples, snr_linear, *params, 123, 1)
+    results_parallel = simulate(samples, snr_linear, *params, 123, 2)
+    for result_serial, result_parallel in zip(results_serial, results_parallel):
+        np.testing.assert_array_equal(result_serial, result_parallel)
@@ -6,7 +6,7 @@ Usage:
 ```
 uavnoma [-h] [-s SAMPLES] [-p POWER_LOS] [-f FACTOR] [-l LOSS] [-r RADIUS] [-ur RADIUS] [-uh MEAN] [-t1 RATE] [-t2 RATE]
         [-hi COEFF] [-si COEFF] [-p1 COEFF] [-p2 COEFF] [--snr-min SNR_MIN] [--snr-max SNR_MAX] [--snr-samples NUM]
-        [--seed SEED] [-o FILE] [--plot] [--no-print]
+        [--seed SEED] [-w NUM] [-o FILE] [--plot] [--no-print]
 ```
 
 Optional arguments:
@@ -43,6 +43,8 @@ Optional arguments:
   --snr-max SNR_MAX     Maximum / finishing SNR in dB (default: 60)
   --snr-samples NUM     Number of SNR samples between SNR_MIN and SNR_MAX (default: 26)
   --seed SEED           Seed for pseudo-random number generator (default: None)
+  -w NUM, --workers NUM
+                        Number of worker processes for the simulation (default: 1)
   -o FILE, --output FILE
                         CSV file where to save simulation data (default: None)
   --plot                Plot the values of the achievable rate and outage probability (default: False)
@@ -118,6 +120,9 @@ def main():
     parser.add_argument('--seed', type=int, metavar="SEED",
                         help="Seed for pseudo-random number generator",
                         default = None)
+    parser.add_argument('-w', '--workers', type=int, metavar='NUM',
+                        help='Number of worker processes for the simulation',
+                        default=1)
     parser.add_argument('-o', '--output', type=str, metavar='FILE',
                         help='CSV file where to save simulation data',
                         default=None)
@@ -140,100 +145,41 @@ def main():
     args = parser.parse_args()
     validate(args)
 
-    # If a seed was defined, set it
-    if (args.seed != None):
-        np.random.seed(args.seed)
-
-    # Initialization of some auxiliary arrays
+    # SNR values
     snr_dB = np.linspace(args.snr_min, args.snr_max, args.snr_samples) # SNR in dB
     snr_linear = 10.0 ** (snr_dB / 10.0)  # SNR linear
-    out_probability_system = np.zeros((args.monte_carlo_samples, len(snr_dB)))
-    out_probability_secondary_user = np.zeros((args.monte_carlo_samples, len(snr_dB)))
-    out_probability_primary_user = np.zeros((args.monte_carlo_samples, len(snr_dB)))
-    system_average_rate = np.zeros((args.monte_carlo_samples, len(snr_dB)))
-    rate_secondary_user = np.zeros((args.monte_carlo_samples, len(snr_dB)))
-    rate_primary_user = np.zeros((args.monte_carlo_samples, len(snr_dB)))
-
-
-    ## Perform simulation
-
-    for mc in range(args.monte_carlo_samples):
-        # Position UAV and users
-        uav_axis_x, uav_axis_y, uav_height = uavnoma.random_position_uav(args.number_uav,
-                                                                        args.radius_uav,
-                                                                        args.uav_height_mean)
-
-        user_axis_x, user_axis_y = uavnoma.random_position_users(args.number_user,
-                                                                args.radius_user)
-
-        s, sigma = uavnoma.fading_rician(args.rician_factor, args.power_los)
-
-        # Generate channel gains
-        channel_gain_primary, channel_gain_secondary =  uavnoma.generate_channel(
-            s,
-            sigma,
-            args.number_user,
-            user_axis_x,
-            user_axis_y,
-            uav_axis_x,
-            uav_axis_y,
-            uav_height,
-            args.path_loss,
-        )
-
-        # Analyzes system performance metrics for various SNR values
-        for sn in range(0, len(snr_dB)):
-
-            # Calculating achievable rate of primary user
-            rate_primary_user[mc, sn] = uavnoma.calculate_instantaneous_rate_primary(
-                channel_gain_primary,
-                snr_linear[sn],
-                args.power_coeff_primary,
-                args.power_coeff_secondary,
-                args.hardw_ip,
-            )
-            # Calculating achievable rate of secondary user
-            rate_secondary_user[mc, sn] = uavnoma.calculate_instantaneous_rate_secondary(
-                channel_gain_secondary,
-                snr_linear[sn],
-                args.power_coeff_secondary,
-                args.power_coeff_primary,
-                args.hardw_ip,
-                args.sic_ip,
-            )
-
-            system_average_rate[mc, sn] = uavnoma.average_rate(rate_primary_user[mc, sn],
-                                                            rate_secondary_user[mc, sn])
-
-            # Calculating of outage probability of the system
-            out_probability_system[mc, sn], out_probability_primary_user[mc,sn], out_probability_secondary_user[mc, sn] = uavnoma.outage_probability(
-                rate_primary_user[mc, sn],
-                rate_secondary_user[mc, sn],
-                args.target_rate_primary_user,
-                args.target_rate_secondary_user,
-            )
-
-    ## Outage Probability
-
-    # Outage probability of the System
-    out_prob_mean = np.mean(out_probability_system, axis=0)
-
-    # Outage probability of the Primary User
-    out_prob_primary = np.mean(out_probability_primary_user, axis=0)
-
-    # Outage probability of the Secondary User
-    out_prob_secondary = np.mean(out_probability_secondary_user, axis=0)
-
-    ## Achievable Rate
-
-    # Average achievable rate of the system
-    average_rate_mean = np.mean(system_average_rate, axis=0)
-
-    # Average achievable rate of the Primary User
-    rate_mean_primary_user = np.mean(rate_primary_user, axis=0)
-
-    # Average achievable rate of the Secondary User
-    rate_mean_secondary_user = np.mean(rate_secondary_user, axis=0)
+
+    ## Perform simulation, with Monte Carlo samples processed in chunks and
+    ## averaged on the fly
+    (
+        out_prob_mean,             # Outage probability of the System
+        out_prob_primary,          # Outage probability of the Primary User
+        out_prob_secondary,        # Outage probability of the Secondary User
+        rate_mean_primary_user,    # Average achievable rate of the Primary User
+        rate_mean_secondary_user,  # Average achievable rate of the Secondary User
+    ) = uavnoma.simulate(
+        args.monte_carlo_samples,
+        snr_linear,
+        args.number_uav,
+        args.radius_uav,
+        args.uav_height_mean,
+        args.number_user,
+        args.radius_user,
+        args.rician_factor,
+        args.power_los,
+        args.path_loss,
+        args.power_coeff_primary,
+        args.power_coeff_secondary,
+        args.hardw_ip,
+        args.sic_ip,
+        args.target_rate_primary_user,
+        args.target_rate_secondary_user,
+        args.seed,
+        args.workers,
+    )
+
+    # Average achievable rate of the system, the mean of the users' mean rates
+    average_rate_mean = uavnoma.average_rate(rate_mean_primary_user, rate_mean_secondary_user)
 
 
     # Put all mean data into a numpy matrix / table
@@ -357,6 +303,10 @@ def validate(args):
         print("Error Detected! SNR maximum value must be (30 <= value <= 80)", file=sys.stderr)
         sys.exit(1)
 
+    if (args.workers < 1):
+        print("Error Detected! Number of workers must be (1 <= value)", file=sys.stderr)
+        sys.exit(1)
+
     if (args.power_coeff_primary < args.power_coeff_secondary):
         print("Error Detected! The power coefficient of the primary user must be greater than that of the Secondary user.", file=sys.stderr)
         sys.exit(1)
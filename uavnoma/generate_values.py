@@ -4,11 +4,11 @@
 """
 
 import numpy as np
-from numpy import sqrt
 import math
 
-def random_position_uav(number_UAV, radius_UAV, uav_height):
-    """Returns a random UAV position based on 3D Cartesian coordinates.
+def random_position_uav(number_UAV, radius_UAV, uav_height, samples=1, rng=None, dtype=np.float64):
+    """Returns random UAV positions based on 3D Cartesian coordinates, one for
+    each Monte Carlo sample.
 
             x_r: x-axis | y_r: y-axis | z_r: height
 
@@ -26,20 +26,30 @@ def random_position_uav(number_UAV, radius_UAV, uav_height):
 
         uav_height -- average flight height
 
+        samples -- number of Monte Carlo samples.
+
+        rng -- NumPy random number generator, a new one is created if not given.
+
+        dtype -- floating point type of the positions, np.float64 or np.float32.
+
     Return:
 
-        x_r, y_r, z_r -- position in the x-axis, y-axis and height of the UAV.
+        x_r, y_r, z_r -- position in the x-axis, y-axis and height of the UAV,
+        arrays with shape (samples, number_UAV).
     """
-    theta_r = np.random.rand(number_UAV, 1) * (math.pi * 2)
+    if rng is None:
+        rng = np.random.default_rng()
+    theta_r = rng.random((samples, number_UAV), dtype=dtype) * (math.pi * 2)
     rho_r = radius_UAV
     x_r = rho_r * np.cos(theta_r)
     y_r = rho_r * np.sin(theta_r)
-    z_r = np.random.uniform(uav_height - 5.0, uav_height + 5.0)
+    z_r = rng.random((samples, number_UAV), dtype=dtype) * 10.0 + (uav_height - 5.0)
     return x_r, y_r, z_r
 
 
-def random_position_users(number_users, radiusUser):
-    """Returns a random ground users position based on 2D Cartesian coordinates.
+def random_position_users(number_users, radiusUser, samples=1, rng=None, dtype=np.float64):
+    """Returns random ground users positions based on 2D Cartesian coordinates,
+    one set for each Monte Carlo sample.
 
             x_u: x-axis |  y_u: y-axis | height is not considered
 
@@ -53,13 +63,22 @@ def random_position_users(number_users, radiusUser):
 
         radiusUser -- distribution radius of users in the cell in meters.
 
+        samples -- number of Monte Carlo samples.
+
+        rng -- NumPy random number generator, a new one is created if not given.
+
+        dtype -- floating point type of the positions, np.float64 or np.float32.
+
     Return:
 
-        x_u, y_u -- position in the x-axis and y-axis of the n-th user.
+        x_u, y_u -- position in the x-axis and y-axis of the n-th user, arrays
+        with shape (samples, number_users).
 
     """
-    theta_u = (np.random.rand(number_users, 1)) * (math.pi * 2)
-    rho_u = np.sqrt(np.random.rand(number_users, 1)) * radiusUser
+    if rng is None:
+        rng = np.random.default_rng()
+    theta_u = (rng.random((samples, number_users), dtype=dtype)) * (math.pi * 2)
+    rho_u = np.sqrt(rng.random((samples, number_users), dtype=dtype)) * radiusUser
     x_u = rho_u * np.cos(theta_u)
     y_u = rho_u * np.sin(theta_u)
     return x_u, y_u
@@ -85,24 +104,29 @@ def fading_rician(K, P_los):
 
 
 def generate_channel(
-    s, sigma, number_user, user_X, user_Y, uav_X, uav_Y, uav_Z, path_loss
+    s, sigma, number_user, user_X, user_Y, uav_X, uav_Y, uav_Z, path_loss, rng=None
 ):
     """Returns the channel gains of the users over Rician Fading. The channel gains are sorted to identify
     the primary user and secondary user.
 
-    `small_scale_fading:` calculating  Rician fading channel gains with complex Gaussian random variables with mean=s and variance=sigma.
+    Positions may carry leading Monte Carlo sample dimensions, in which case the user
+    positions have shape (..., number_user) and the UAV positions broadcast against them,
+    e.g. shape (..., 1).
 
-    `large_scale_fading:`  large-scale fading
+    `small_scale_fading:` calculating  Rician fading power gains as the squared magnitude of complex Gaussian random variables,
+    with real part of mean=s and standard deviation=sigma and imaginary part of mean=0 and standard deviation=sigma.
 
-    `distance:` calculating distance between UAV and users.
+    `large_scale_fading:`  large-scale fading (path loss attenuation in power)
+
+    `distance_squared:` calculating squared distance between UAV and users.
 
     `h_n:` calculates channel coefficients based on the distance.
 
-    `channelGain:` calculates the channel gains and sorting in descending order.
+    `channel_gain:` calculates the channel gains and sorting in ascending order.
 
-        Primary user:  channelGain[0]   -> min value
+        Primary user:  channel_gain[..., 0]   -> min value
 
-        Secondary user:  channelGain[1] -> max value
+        Secondary user:  channel_gain[..., -1] -> max value
 
     Arguments:
 
@@ -112,9 +136,9 @@ def generate_channel(
 
         number_user -- number of user.
 
-        user_X -- position axis x of n-th user.
+        user_X -- position axis x of the users, last axis indexes the n-th user.
 
-        user_Y -- position axis y of n-th user.
+        user_Y -- position axis y of the users, last axis indexes the n-th user.
 
         uav_X -- position axis x of UAV.
 
@@ -124,6 +148,8 @@ def generate_channel(
 
         path_loss -- path loss exponent.
 
+        rng -- NumPy random number generator, a new one is created if not given.
+
     Return:
 
         channel_primary --  channel gain of the primary user.
@@ -131,31 +157,47 @@ def generate_channel(
         channel_secondary --  channel gain of the secondary user.
 
     """
-    # Initializing auxiliary arrays to store channel coefficients and distance between UAV and users, respectively:
-    h_n = np.zeros(number_user)
-    distance = np.zeros(number_user)
-
-    for uu in range(number_user):
-
-        # Generate small scale fading according to Rician Distribution
-        small_scale_fading = np.sqrt(
-            (np.random.normal(s, sigma) ** 2)
-            + 1j * (np.random.normal(0, sigma) ** 2)
-        )
-        # Normalized distance
-        distance[uu] = np.sqrt(
-            (user_X[uu] - uav_X) ** 2 + (user_Y[uu] - uav_Y) ** 2 + uav_Z ** 2
-        )
-        # Generate path loss atenuation
-        large_scale_fading = sqrt( (distance[uu])**( path_loss))
-
-        # Generate channel coefficients
-        h_n[uu] = (
-            np.abs(small_scale_fading / large_scale_fading )
-            ** 2
-        )
-
-    channel_primary = np.min(h_n)
-    channel_secondary = np.max(h_n)
+    if np.shape(user_X)[-1] != number_user or np.shape(user_Y)[-1] != number_user:
+        raise IndexError("User positions must be given for {} users".format(number_user))
+
+    if sigma < 0:
+        raise ValueError("Standard deviation must be non-negative")
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Squared normalized distance between UAV and users, the path loss attenuation
+    # below is computed directly from it, without taking the square root
+    distance_squared = (
+        (user_X - uav_X) ** 2 + (user_Y - uav_Y) ** 2 + uav_Z ** 2
+    )
+
+    # Generate small scale fading according to Rician Distribution, i.e. the squared
+    # magnitude |x_r + j*x_i|^2, computed with real arithmetic. Real and imaginary
+    # parts are drawn in a single call, only the real part has mean s. Fading values
+    # have the same floating point type as the distances (at least single precision)
+    fading = rng.standard_normal(
+        distance_squared.shape + (2,), dtype=np.result_type(distance_squared, np.float32)
+    )
+    fading *= sigma
+    fading[..., 0] += s
+    fading_real = fading[..., 0]
+    fading_imag = fading[..., 1]
+    small_scale_fading = fading_real * fading_real + fading_imag * fading_imag
+
+    # Generate path loss atenuation
+    large_scale_fading = distance_squared ** (path_loss / 2)
+
+    # Generate channel coefficients
+    h_n = small_scale_fading / large_scale_fading
+
+    # Weakest channel gain is the primary user and strongest the secondary. With two
+    # users an elementwise comparison is enough, otherwise sort the channel gains once
+    if number_user == 2:
+        channel_primary = np.minimum(h_n[..., 0], h_n[..., 1])
+        channel_secondary = np.maximum(h_n[..., 0], h_n[..., 1])
+    else:
+        channel_gain = np.sort(h_n, axis=-1)
+        channel_primary = channel_gain[..., 0]
+        channel_secondary = channel_gain[..., -1]
 
     return channel_primary, channel_secondary
\ No newline at end of file
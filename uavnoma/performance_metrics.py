@@ -3,11 +3,18 @@
 """
 
 import numpy as np
+import math
+
+# Conversion factor from nats to bits, log2(x) = ln(x) * LOG2_E
+LOG2_E = 1.0 / math.log(2.0)
 
 def calculate_instantaneous_rate_primary(
     channelPri, snrValues, powerPrimary, powerSecondary,  hardw_ip):
     """Returns the instantaneous achievable rate of the primary user for each SNR value in linear.
 
+    `channelPri` and `snrValues` broadcast against each other, e.g. channel gains of shape
+    (samples, 1) and SNR values of shape (N_snr,) give rates of shape (samples, N_snr).
+
     `sinr_primary:` generates the Signal-to-interference-plus-noise ratio (SINR) experienced by the primary user based on NOMA.
 
     `inst_rate_primary:` calculates instantaneous rate of the primary user based on sinr_primary.
@@ -28,20 +35,25 @@ def calculate_instantaneous_rate_primary(
 
     Return:
 
-        inst_rate_primary -- instantaneous achievable rate of the primary user.
+        inst_rate_primary -- instantaneous achievable rate of the primary user in bits/s/Hz.
     """
-    sinr_primary = (snrValues * channelPri * powerPrimary) / (
-        snrValues * channelPri * ( powerSecondary + hardw_ip**2  ) + 1
+    # Power coefficients are applied to the SNR values first, which do not depend on the
+    # Monte Carlo sample, so only the products with the channel gains are broadcast
+    sinr_primary = (channelPri * (snrValues * powerPrimary)) / (
+        channelPri * (snrValues * ( powerSecondary + hardw_ip**2 )) + 1
     )
-    inst_rate_primary = np.log(
-        1 + sinr_primary
-    )  # Instantaneous achievable rate of primary user NOMA
+    inst_rate_primary = np.log1p(
+        sinr_primary
+    ) * LOG2_E  # Instantaneous achievable rate of primary user NOMA in bits/s/Hz
 
     return inst_rate_primary
 
 def calculate_instantaneous_rate_secondary(channelSec, snrValues, powerSecondary, powerPrimary, hardw_ip, sic_ip):
     """Returns the instantaneous achievable rate of the secondary user for all values of SNR in dB.
 
+    `channelSec` and `snrValues` broadcast against each other, e.g. channel gains of shape
+    (samples, 1) and SNR values of shape (N_snr,) give rates of shape (samples, N_snr).
+
     `sinr_secondary:` generates the Signal-to-interference-plus-noise ratio (SINR) experienced by the secondary user based on NOMA.
 
     `inst_rate_secondary:` calculates instantaneous rate of the secondary user based on sinr_secondary.
@@ -63,15 +75,17 @@ def calculate_instantaneous_rate_secondary(channelSec, snrValues, powerSecondary
 
     Return:
 
-        inst_rate_secondary -- instantaneous achievable rate of the secondary user.
+        inst_rate_secondary -- instantaneous achievable rate of the secondary user in bits/s/Hz.
     """
 
-    sinr_secondary = ( snrValues * channelSec * powerSecondary ) / (
-        snrValues * channelSec * ( powerPrimary*sic_ip + hardw_ip**2 ) + 1
+    # Power coefficients are applied to the SNR values first, which do not depend on the
+    # Monte Carlo sample, so only the products with the channel gains are broadcast
+    sinr_secondary = (channelSec * (snrValues * powerSecondary)) / (
+        channelSec * (snrValues * ( powerPrimary*sic_ip + hardw_ip**2 )) + 1
     )
-    inst_rate_secondary = np.log(
-        1 + sinr_secondary
-    )  # Instantaneous achievable rate of secondary user
+    inst_rate_secondary = np.log1p(
+        sinr_secondary
+    ) * LOG2_E  # Instantaneous achievable rate of secondary user in bits/s/Hz
 
     return inst_rate_secondary
 
@@ -102,8 +116,8 @@ def outage_probability(
     target_rate_primary_user,
     target_rate_secondary_user,
     ):
-    """Returns the outage probability for the system, primary user, and secondary user
-    for SNR value in linear.
+    """Returns the outage events for the system, primary user, and secondary user
+    for SNR value in linear, as boolean arrays.
 
     Arguments:
 
@@ -111,28 +125,27 @@ def outage_probability(
 
         instantaneous_rate_secondary -- instantaneous achievable rate of the secondary user.
 
+        target_rate_primary_user -- target rate of the primary user.
+
+        target_rate_secondary_user -- target rate of the secondary user.
+
     Return:
 
-        avr_rate -- average achievable rate in bits/s/Hz
+        out_probability_system -- True where the system is in outage, False otherwise.
+
+        out_probability_primary_user -- True where the primary user is in outage, False otherwise.
+
+        out_probability_secondary_user -- True where the secondary user is in outage, False otherwise.
     """
 
-    if (instantaneous_rate_primary < target_rate_primary_user) or (
-        instantaneous_rate_secondary < target_rate_secondary_user
-    ):
-        out_probability_system = 1
-    else:
-        out_probability_system = 0
-
-    # Calculating of outage probability of the primary user
-    if instantaneous_rate_primary< target_rate_primary_user:
-        out_probability_primary_user = 1
-    else:
-        out_probability_primary_user = 0
-
-    # Calculating of outage probability of the secondary user
-    if instantaneous_rate_secondary < target_rate_secondary_user:
-        out_probability_secondary_user = 1
-    else:
-        out_probability_secondary_user = 0
+    # Calculating of outage of the primary and secondary users
+    outage_primary = instantaneous_rate_primary < target_rate_primary_user
+    outage_secondary = instantaneous_rate_secondary < target_rate_secondary_user
+
+    # Outages are kept as booleans, the mean over Monte Carlo samples gives the
+    # outage probability. The system is in outage when any of the users is
+    out_probability_system = outage_primary | outage_secondary
+    out_probability_primary_user = outage_primary
+    out_probability_secondary_user = outage_secondary
 
     return out_probability_system, out_probability_primary_user, out_probability_secondary_user
@@ -0,0 +1,230 @@
+"""
+    This module contains the function to perform the Monte Carlo simulation of the system.
+"""
+
+import multiprocessing
+import numpy as np
+from .generate_values import fading_rician
+from .generate_values import random_position_uav
+from .generate_values import random_position_users
+from .generate_values import generate_channel
+from .performance_metrics import calculate_instantaneous_rate_primary
+from .performance_metrics import calculate_instantaneous_rate_secondary
+from .performance_metrics import outage_probability
+
+# Number of Monte Carlo samples simulated together, each chunk of samples using
+# its own random stream, so that results do not depend on the number of workers
+CHUNK_SAMPLES = 1000
+
+# Floating point type of the values of each Monte Carlo sample, which only need a few
+# significant digits. Sums over the samples are always accumulated in float64
+SAMPLE_DTYPE = np.float32
+
+def simulate(
+    monte_carlo_samples,
+    snr_linear,
+    number_uav,
+    radius_uav,
+    uav_height_mean,
+    number_user,
+    radius_user,
+    rician_factor,
+    power_los,
+    path_loss,
+    power_primary,
+    power_secondary,
+    hardw_ip,
+    sic_ip,
+    target_rate_primary_user,
+    target_rate_secondary_user,
+    seed=None,
+    workers=1,
+):
+    """Returns the outage probabilities and average achievable rates for each SNR value.
+
+    Monte Carlo samples are processed in chunks of `CHUNK_SAMPLES` with array operations,
+    optionally in parallel worker processes. Each chunk draws from an independent random
+    stream spawned from `seed` and only returns its outage counts and rate sums, so memory
+    use does not grow with the number of samples. The results are arrays of shape
+    (len(snr_linear),). The average achievable rate of the system is not returned, since
+    it is the mean of the users' average rates, see `average_rate()`.
+
+    Arguments:
+
+        monte_carlo_samples -- number of Monte Carlo samples.
+
+        snr_linear -- linear SNR values.
+
+        number_uav -- number of UAV.
+
+        radius_uav -- flight trajectory of the UAV in meters.
+
+        uav_height_mean -- average UAV flight height.
+
+        number_user -- number of users.
+
+        radius_user -- distribution radius of users in the cell in meters.
+
+        rician_factor -- Rician factor.
+
+        power_los -- power of line-of-sight path and scattered paths.
+
+        path_loss -- path loss exponent.
+
+        power_primary --  power coefficient allocated to the Primary user.
+
+        power_secondary --  power coefficient allocated to the Secondary user.
+
+        hardw_ip -- hardware impairments coefficient.
+
+        sic_ip -- imperfect SIC coefficient.
+
+        target_rate_primary_user -- target rate of the primary user.
+
+        target_rate_secondary_user -- target rate of the secondary user.
+
+        seed -- seed for the pseudo-random number generators, None for a random seed.
+
+        workers -- number of worker processes.
+
+    Return:
+
+        out_prob_system -- outage probability of the system.
+
+        out_prob_primary -- outage probability of the primary user.
+
+        out_prob_secondary -- outage probability of the secondary user.
+
+        rate_mean_primary_user -- average achievable rate of the primary user.
+
+        rate_mean_secondary_user -- average achievable rate of the secondary user.
+    """
+    # Split Monte Carlo samples in chunks, each with an independent random generator
+    chunks = [CHUNK_SAMPLES] * (monte_carlo_samples // CHUNK_SAMPLES)
+    if monte_carlo_samples % CHUNK_SAMPLES > 0:
+        chunks.append(monte_carlo_samples % CHUNK_SAMPLES)
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+    tasks = [
+        (
+            chunk_samples,
+            snr_linear,
+            number_uav,
+            radius_uav,
+            uav_height_mean,
+            number_user,
+            radius_user,
+            rician_factor,
+            power_los,
+            path_loss,
+            power_primary,
+            power_secondary,
+            hardw_ip,
+            sic_ip,
+            target_rate_primary_user,
+            target_rate_secondary_user,
+            np.random.default_rng(chunk_seed),
+        )
+        for chunk_samples, chunk_seed in zip(chunks, seeds)
+    ]
+
+    # Chunks are independent, simulate them in parallel if more than one worker is requested
+    if workers > 1 and len(tasks) > 1:
+        with multiprocessing.Pool(min(workers, len(tasks))) as pool:
+            results = pool.starmap(_simulate_chunk, tasks)
+    else:
+        results = [_simulate_chunk(*task) for task in tasks]
+
+    # Accumulate the results of all chunks and average over all Monte Carlo samples
+    return tuple(
+        np.sum(chunk_results, axis=0) / monte_carlo_samples
+        for chunk_results in zip(*results)
+    )
+
+def _simulate_chunk(
+    monte_carlo_samples,
+    snr_linear,
+    number_uav,
+    radius_uav,
+    uav_height_mean,
+    number_user,
+    radius_user,
+    rician_factor,
+    power_los,
+    path_loss,
+    power_primary,
+    power_secondary,
+    hardw_ip,
+    sic_ip,
+    target_rate_primary_user,
+    target_rate_secondary_user,
+    rng,
+):
+    """Simulates a chunk of Monte Carlo samples at once, returning the outage counts and
+    rate sums over the chunk's samples for each SNR value, see `simulate()`."""
+    # Rician fading parameters do not change between Monte Carlo samples
+    s, sigma = fading_rician(rician_factor, power_los)
+
+    # Position UAV and users, arrays of shape (samples, number of UAV/users)
+    uav_axis_x, uav_axis_y, uav_height = random_position_uav(
+        number_uav, radius_uav, uav_height_mean, monte_carlo_samples, rng, SAMPLE_DTYPE
+    )
+    user_axis_x, user_axis_y = random_position_users(
+        number_user, radius_user, monte_carlo_samples, rng, SAMPLE_DTYPE
+    )
+
+    # Generate channel gains, arrays of shape (samples,)
+    channel_gain_primary, channel_gain_secondary = generate_channel(
+        s,
+        sigma,
+        number_user,
+        user_axis_x,
+        user_axis_y,
+        uav_axis_x,
+        uav_axis_y,
+        uav_height,
+        path_loss,
+        rng,
+    )
+
+    # Analyzes system performance metrics for all SNR values, with channel gains
+    # as column vectors so that results have shape (samples, SNR values)
+    snr_linear = np.asarray(snr_linear, dtype=SAMPLE_DTYPE)
+
+    # Calculating achievable rate of primary user
+    rate_primary_user = calculate_instantaneous_rate_primary(
+        channel_gain_primary[:, np.newaxis],
+        snr_linear,
+        power_primary,
+        power_secondary,
+        hardw_ip,
+    )
+    # Calculating achievable rate of secondary user
+    rate_secondary_user = calculate_instantaneous_rate_secondary(
+        channel_gain_secondary[:, np.newaxis],
+        snr_linear,
+        power_secondary,
+        power_primary,
+        hardw_ip,
+        sic_ip,
+    )
+
+    # Calculating of outage probability of the system and of each user
+    (
+        out_probability_system,
+        out_probability_primary_user,
+        out_probability_secondary_user,
+    ) = outage_probability(
+        rate_primary_user,
+        rate_secondary_user,
+        target_rate_primary_user,
+        target_rate_secondary_user,
+    )
+
+    # Reduce over the chunk's samples, only arrays of shape (SNR values,) are kept
+    return (
+        np.count_nonzero(out_probability_system, axis=0),
+        np.count_nonzero(out_probability_primary_user, axis=0),
+        np.count_nonzero(out_probability_secondary_user, axis=0),
+        np.sum(rate_primary_user, axis=0, dtype=np.float64),
+        np.sum(rate_secondary_user, axis=0, dtype=np.float64),
+    )